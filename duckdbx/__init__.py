@@ -4,7 +4,10 @@ DuckDBX - Ephemeral DuckDB instances in Docker containers.
 
 __version__ = "0.1.0"
 
-from duckdbx.core import DuckDBX
+import atexit
+import sys
+
+from duckdbx.config import Config
 from duckdbx.exceptions import (
     DuckDBXError,
     ContainerError,
@@ -14,9 +17,47 @@ from duckdbx.exceptions import (
 
 __all__ = [
     "DuckDBX",
+    "ExecuteResult",
+    "ContainerPool",
+    "start_many",
+    "Config",
     "DuckDBXError",
     "ContainerError",
     "DuckDBConnectionError",
     "ConfigurationError",
+    "shutdown",
 ]
 
+# Names imported on first access so `import duckdbx` doesn't load duckdb/docker
+_LAZY_ATTRS = {
+    "DuckDBX": "duckdbx.core",
+    "ExecuteResult": "duckdbx.core",
+    "start_many": "duckdbx.core",
+    "ContainerPool": "duckdbx.pool",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def shutdown() -> None:
+    """Release process-wide resources (the shared Docker client)."""
+    container = sys.modules.get("duckdbx.container")
+    if container is not None:
+        container.close_docker_client()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,170 @@
+"""Minimal Docker Engine API client over a Unix domain socket."""
+
+import http.client
+import json
+import socket
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from docker.errors import APIError, DockerException, NotFound
+
+# Safe to resend even if the daemon may already have processed the request
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Errors meaning a reused keep-alive socket was closed before the request was
+# read; other failures (e.g. a read timeout) may come after it was handled
+_STALE_CONNECTION_ERRORS = (BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class UdsHttpClient:
+    """
+    Docker Engine API client for the hot container calls.
+
+    Each thread keeps one persistent HTTP/1.1 connection to the daemon socket,
+    so repeated inspect/create/start/delete calls skip docker-py's
+    requests/urllib3 stack and reuse the same socket.
+    """
+
+    def __init__(self, socket_path: str, api_version: str, timeout: float = 60):
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Path of the Docker daemon Unix socket
+            api_version: Docker Engine API version (e.g. "1.43")
+            timeout: Socket timeout in seconds
+        """
+        self.socket_path = socket_path
+        self.api_version = api_version
+        self.timeout = timeout
+        self._local = threading.local()
+        # Every thread's connection, so close() can reach all of them; weak so
+        # connections of finished threads are not kept alive
+        self._connections: "weakref.WeakSet[_UnixHTTPConnection]" = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+
+    def _connection(self) -> _UnixHTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.add(conn)
+        return conn
+
+    def _reset(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._connections_lock:
+                self._connections.discard(conn)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        ignore_statuses: Tuple[int, ...] = (),
+    ) -> Any:
+        """
+        Send an API request and return the decoded JSON response.
+
+        Args:
+            method: HTTP method
+            path: API path without the version prefix (e.g. "/containers/json")
+            params: Optional query parameters
+            body: Optional JSON request body
+            ignore_statuses: Error statuses to treat as success
+
+        Returns:
+            Decoded JSON body, or None for empty responses
+        """
+        url = f"/v{self.api_version}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+
+        while True:
+            conn = self._connection()
+            reused = conn.sock is not None
+            try:
+                conn.request(method, url, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                self._reset()
+                # Retry once on a fresh socket if the daemon closed an idle
+                # connection, unless resending could repeat a handled request
+                retry = reused and (
+                    method in _IDEMPOTENT_METHODS or isinstance(e, _STALE_CONNECTION_ERRORS)
+                )
+                if not retry:
+                    raise DockerException(f"Docker API request {method} {path} failed: {e}")
+
+        if response.will_close:
+            self._reset()
+
+        try:
+            result = json.loads(data) if data else None
+        except ValueError:
+            result = None
+        if response.status >= 400 and response.status not in ignore_statuses:
+            message = result.get("message") if isinstance(result, dict) else data.decode()
+            error = NotFound if response.status == 404 else APIError
+            raise error(f"{response.status} {method} {path}: {message}")
+        return result
+
+    def inspect_container(self, container_id: str) -> Dict[str, Any]:
+        """GET /containers/{id}/json."""
+        return self.request("GET", f"/containers/{container_id}/json")
+
+    def create_container(self, name: str, body: Dict[str, Any]) -> str:
+        """POST /containers/create; returns the new container ID."""
+        return self.request("POST", "/containers/create", params={"name": name}, body=body)["Id"]
+
+    def start_container(self, container_id: str) -> None:
+        """POST /containers/{id}/start."""
+        self.request("POST", f"/containers/{container_id}/start")
+
+    def remove_container(self, container_id: str) -> None:
+        """DELETE /containers/{id}?force=1; kills and removes in one call."""
+        # 404/409: already removed, or auto-removal is already in progress
+        self.request(
+            "DELETE",
+            f"/containers/{container_id}",
+            params={"force": "1"},
+            ignore_statuses=(404, 409),
+        )
+
+    def close(self) -> None:
+        """Close the connections of every thread using this client."""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
@@ -1,18 +1,82 @@
 """Configuration management for DuckDBX."""
 
 import os
-from typing import Optional, Dict, Any
+import re
+import types
+from typing import Optional, Dict, Any, List, Mapping, Union
 from duckdbx.exceptions import ConfigurationError
 
 
+class _InvalidEnvValue:
+    """Placeholder for an environment variable that failed to parse."""
+
+    def __init__(self, name: str, value: str, expected: str):
+        self.name = name
+        self.value = value
+        self.expected = expected
+
+    def error(self) -> ConfigurationError:
+        return ConfigurationError(
+            f"{self.name} must be {self.expected}, got {self.value!r}"
+        )
+
+
+def _env_int(name: str, default: int) -> Union[int, _InvalidEnvValue]:
+    """Read an integer environment variable."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        # Reported when a Config uses this default, not at import time
+        return _InvalidEnvValue(name, value, "an integer")
+
+
+def _env_bool(name: str) -> bool:
+    """Read a boolean flag environment variable."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_list(name: str) -> List[str]:
+    """Read a comma-separated list environment variable."""
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+def _read_env_defaults() -> Mapping[str, Any]:
+    """Snapshot environment variables and built-in defaults."""
+    return types.MappingProxyType({
+        "container_image": os.getenv("DUCKDBX_CONTAINER_IMAGE") or "duckdbx:latest",
+        "container_name": os.getenv("DUCKDBX_CONTAINER_NAME") or "duckdbx",
+        "port": _env_int("DUCKDBX_PORT", 0),
+        "pool_size": _env_int("DUCKDBX_POOL_SIZE", 4),
+        "keep_for_inspection": _env_bool("DUCKDBX_KEEP_FOR_INSPECTION"),
+        "preload_extensions": tuple(_env_list("DUCKDBX_PRELOAD_EXTENSIONS")),
+        "unix_socket": _env_bool("DUCKDBX_UNIX_SOCKET"),
+    })
+
+
+# Read once at import time; see Config.refresh_env()
+_ENV_DEFAULTS = _read_env_defaults()
+
+_EXTENSION_NAME_RE = re.compile(r"^\w+$")
+
+
 class Config:
     """Configuration loader with priority: params > env vars."""
 
+    # Set on the shared default instance; see Config.validated_default()
+    _frozen = False
+
     def __init__(
         self,
         container_image: Optional[str] = None,
         container_name: Optional[str] = None,
         port: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        keep_for_inspection: Optional[bool] = None,
+        preload_extensions: Optional[List[str]] = None,
+        unix_socket: Optional[bool] = None,
     ):
         """
         Initialize configuration.
@@ -21,19 +85,72 @@ class Config:
             container_image: Docker image name for DuckDB container
             container_name: Container name prefix
             port: Port number for DuckDB connection (auto-assigned if None)
+            pool_size: Maximum number of pooled DuckDB cursors
+            keep_for_inspection: Keep stopped containers instead of removing them
+            preload_extensions: DuckDB extensions to load on the host-side
+                connection, installed first if they are not yet available
+            unix_socket: Experimental; share a Unix socket directory with
+                local containers (unused by the current image)
         """
         # Priority: params > env vars > defaults
-        self.container_image = (
-            container_image
-            or os.getenv("DUCKDBX_CONTAINER_IMAGE")
-            or "duckdbx:latest"
+        self.container_image = container_image or _ENV_DEFAULTS["container_image"]
+        self.container_name = container_name or _ENV_DEFAULTS["container_name"]
+        self.port = port if port is not None else _ENV_DEFAULTS["port"]
+        self.pool_size = pool_size if pool_size is not None else _ENV_DEFAULTS["pool_size"]
+        self.keep_for_inspection = (
+            keep_for_inspection
+            if keep_for_inspection is not None
+            else _ENV_DEFAULTS["keep_for_inspection"]
+        )
+        self.preload_extensions = tuple(
+            preload_extensions
+            if preload_extensions is not None
+            else _ENV_DEFAULTS["preload_extensions"]
         )
-        self.container_name = (
-            container_name
-            or os.getenv("DUCKDBX_CONTAINER_NAME")
-            or "duckdbx"
+        self.unix_socket = (
+            unix_socket if unix_socket is not None else _ENV_DEFAULTS["unix_socket"]
         )
-        self.port = port or int(os.getenv("DUCKDBX_PORT", "0"))
+
+        for value in (self.port, self.pool_size):
+            if isinstance(value, _InvalidEnvValue):
+                raise value.error()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(
+                "The shared default Config is read-only; create a Config() to customize"
+            )
+        super().__setattr__(name, value)
+
+    @classmethod
+    def refresh_env(cls) -> None:
+        """Re-read environment variable defaults (e.g. after tests patch os.environ)."""
+        global _ENV_DEFAULTS, _VALIDATED_DEFAULT_CONFIG
+        _ENV_DEFAULTS = _read_env_defaults()
+        _VALIDATED_DEFAULT_CONFIG = cls._build_and_validate_defaults()
+
+    @classmethod
+    def _build_and_validate_defaults(cls) -> Optional["Config"]:
+        """Build the all-defaults configuration, or None if it is invalid."""
+        try:
+            config = cls()
+            config.validate()
+        except ConfigurationError:
+            return None
+        config._frozen = True
+        return config
+
+    @classmethod
+    def validated_default(cls) -> "Config":
+        """
+        Get the shared, already-validated all-defaults configuration.
+
+        The returned object is shared between callers and is read-only.
+        Raises ConfigurationError if the environment defaults are invalid.
+        """
+        if _VALIDATED_DEFAULT_CONFIG is None:
+            cls().validate()  # Raises the error for the invalid default
+        return _VALIDATED_DEFAULT_CONFIG
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -41,6 +158,10 @@ class Config:
             "container_image": self.container_image,
             "container_name": self.container_name,
             "port": self.port,
+            "pool_size": self.pool_size,
+            "keep_for_inspection": self.keep_for_inspection,
+            "preload_extensions": self.preload_extensions,
+            "unix_socket": self.unix_socket,
         }
 
     def validate(self) -> None:
@@ -49,4 +170,12 @@ class Config:
             raise ConfigurationError("container_image is required")
         if not self.container_name:
             raise ConfigurationError("container_name is required")
+        if self.pool_size < 1:
+            raise ConfigurationError("pool_size must be at least 1")
+        for ext in self.preload_extensions:
+            if not _EXTENSION_NAME_RE.match(ext):
+                raise ConfigurationError(f"Invalid extension name: {ext!r}")
+
 
+# Validated once at import time; see Config.validated_default()
+_VALIDATED_DEFAULT_CONFIG = Config._build_and_validate_defaults()
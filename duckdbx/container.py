@@ -1,17 +1,109 @@
 """Docker container management for DuckDBX."""
 
+import itertools
+import os
+import shutil
 import socket
+import stat
+import tempfile
+import threading
 import time
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 import docker
-from docker.errors import DockerException
+from docker.errors import DockerException, NotFound
 
 from duckdbx.exceptions import ContainerError
 from duckdbx.config import Config
+from duckdbx._docker_transport import UdsHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Per-process counter making container names unique
+_NAME_COUNTER = itertools.count()
+
+# Docker client shared by every ContainerManager in the process
+_SHARED_DOCKER_CLIENT: Optional[docker.DockerClient] = None
+_SHARED_DOCKER_CLIENT_LOCK = threading.Lock()
+
+# Direct Unix-socket client for hot API calls (local engines only)
+_SHARED_TRANSPORT: Optional[UdsHttpClient] = None
+
+# Connections kept open to the Docker daemon by the shared client
+_DOCKER_MAX_POOL_SIZE = 32
+
+# Container path of the per-container data volume
+_DATA_MOUNT = "/data"
+_DATABASE_FILE = "duckdb.db"
+
+# Container directory holding the DuckDB Unix domain socket
+_SOCKET_MOUNT = "/var/run/duckdbx"
+_SOCKET_FILE = "duckdb.sock"
+
+# Seconds a container status read stays fresh
+_STATUS_CACHE_TTL = 0.25
+
+# Container events that mean the container is up
+_READY_EVENTS = ("start", "health_status: healthy")
+
+# TCP readiness probe: attempts, per-attempt connect timeout, delay between
+_PROBE_ATTEMPTS = 30
+_PROBE_TIMEOUT = 0.1
+_PROBE_INTERVAL = 0.03
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Get the process-wide Docker client, creating it on first use."""
+    global _SHARED_DOCKER_CLIENT
+    if _SHARED_DOCKER_CLIENT is None:
+        with _SHARED_DOCKER_CLIENT_LOCK:
+            if _SHARED_DOCKER_CLIENT is None:
+                try:
+                    _SHARED_DOCKER_CLIENT = docker.from_env(
+                        max_pool_size=_DOCKER_MAX_POOL_SIZE
+                    )
+                except DockerException as e:
+                    raise ContainerError(f"Failed to connect to Docker: {e}") from e
+    return _SHARED_DOCKER_CLIENT
+
+
+def get_docker_transport() -> Optional[UdsHttpClient]:
+    """Get the shared Unix-socket API client, or None if the engine is not local."""
+    global _SHARED_TRANSPORT
+    if _SHARED_TRANSPORT is None:
+        client = get_docker_client()
+        socket_path = getattr(client.api.adapters.get("http+docker://"), "socket_path", None)
+        if socket_path is None:
+            return None
+        with _SHARED_DOCKER_CLIENT_LOCK:
+            if _SHARED_TRANSPORT is None:
+                _SHARED_TRANSPORT = UdsHttpClient(socket_path, client.api.api_version)
+    return _SHARED_TRANSPORT
+
+
+def docker_cpu_count() -> Optional[int]:
+    """Number of CPUs available to the Docker engine, if it can be determined."""
+    try:
+        return int(get_docker_client().info()["NCPU"])
+    except (DockerException, ContainerError, KeyError, TypeError, ValueError) as e:
+        logger.debug(f"Could not read Docker CPU count: {e}")
+        return None
+
+
+def close_docker_client() -> None:
+    """Close the shared Docker client, if one has been created."""
+    global _SHARED_DOCKER_CLIENT, _SHARED_TRANSPORT
+    with _SHARED_DOCKER_CLIENT_LOCK:
+        if _SHARED_TRANSPORT is not None:
+            _SHARED_TRANSPORT.close()
+            _SHARED_TRANSPORT = None
+        if _SHARED_DOCKER_CLIENT is not None:
+            try:
+                _SHARED_DOCKER_CLIENT.close()
+            except DockerException as e:
+                logger.warning(f"Error closing Docker client: {e}")
+            _SHARED_DOCKER_CLIENT = None
+
 
 class ContainerManager:
     """Manages Docker container lifecycle for DuckDB instances."""
@@ -27,37 +119,58 @@ class ContainerManager:
         self.client = None
         self.container = None
         self.port = None
-        self._docker_client = None
+        self.data_dir: Optional[str] = None
+        self.socket_dir: Optional[str] = None
+        self._status_cache: Optional[Tuple[float, str]] = None
+        self._ready_event = threading.Event()
+        self._ready_from_events = False
 
-    def _get_docker_client(self):
-        """Get or create Docker client."""
-        if self._docker_client is None:
-            try:
-                self._docker_client = docker.from_env()
-            except DockerException as e:
-                raise ContainerError(f"Failed to connect to Docker: {e}") from e
-        return self._docker_client
-
-    def _find_available_port(self) -> int:
-        """Find an available port on the host."""
-        if self.config.port and self.config.port > 0:
-            # Check if specified port is available
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            try:
-                sock.bind(("", self.config.port))
-                sock.close()
-                return self.config.port
-            except OSError:
-                raise ContainerError(
-                    f"Port {self.config.port} is already in use"
-                )
-        else:
-            # Find any available port
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.bind(("", 0))
-            port = sock.getsockname()[1]
+    def _get_docker_client(self) -> docker.DockerClient:
+        """Get the process-wide Docker client, creating it on first use."""
+        return get_docker_client()
+
+    @staticmethod
+    def _is_local_engine(client: docker.DockerClient) -> bool:
+        """Check whether the Docker engine is reached over a local Unix socket."""
+        return client.api.base_url == "http+docker://localhost"
+
+    def _supports_unix_socket(self, client: docker.DockerClient) -> bool:
+        """Check whether a bind-mounted Unix socket can reach the container."""
+        if not self._is_local_engine(client):
+            return False
+        # Docker Desktop runs the engine in a VM; sockets don't cross the mount
+        return client.info().get("OperatingSystem") != "Docker Desktop"
+
+    def _check_port_available(self, port: int) -> None:
+        """Ensure an explicitly configured host port can be bound."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Don't reject ports that are only lingering in TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("", port))
+        except OSError:
+            raise ContainerError(f"Port {port} is already in use")
+        finally:
             sock.close()
-            return port
+
+    def _reload(self) -> str:
+        """Refresh container attributes from Docker and cache the status."""
+        transport = get_docker_transport()
+        if transport is not None:
+            self.container.attrs = transport.inspect_container(self.container.id)
+        else:
+            self.container.reload()
+        self._status_cache = (time.monotonic(), self.container.status)
+        return self.container.status
+
+    def _read_host_port(self) -> int:
+        """Read the host port Docker assigned to the DuckDB port."""
+        self._reload()
+        try:
+            bindings = self.container.attrs["NetworkSettings"]["Ports"]["3141/tcp"]
+            return int(bindings[0]["HostPort"])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ContainerError(f"Could not determine container host port: {e}") from e
 
     def start(self) -> str:
         """
@@ -72,75 +185,218 @@ class ContainerManager:
 
         try:
             client = self._get_docker_client()
-            self.port = self._find_available_port()
+            if self.config.port and self.config.port > 0:
+                self._check_port_available(self.config.port)
+                host_port = self.config.port
+            else:
+                host_port = None  # Let Docker pick a free port
+
+            # Per-container data volume shared with the host
+            self.data_dir = tempfile.mkdtemp(prefix="duckdbx-")
+            volumes = {self.data_dir: {"bind": _DATA_MOUNT, "mode": "rw"}}
+            environment = {}
+
+            # Experimental: share a socket directory when asked and the engine
+            # runs on this host. The image does not create the socket yet.
+            if self.config.unix_socket and self._supports_unix_socket(client):
+                self.socket_dir = tempfile.mkdtemp(prefix="duckdbx-sock-")
+                volumes[self.socket_dir] = {"bind": _SOCKET_MOUNT, "mode": "rw"}
+                environment["DUCKDB_LISTEN_SOCKET"] = f"{_SOCKET_MOUNT}/{_SOCKET_FILE}"
 
             # Generate unique container name
-            container_name = f"{self.config.container_name}-{int(time.time())}"
-
-            # Start container
-            logger.info(f"Starting container {container_name} on port {self.port}")
-            self.container = client.containers.run(
-                self.config.container_image,
-                name=container_name,
-                ports={"3141/tcp": self.port},  # DuckDB default HTTP port
-                detach=True,
-                remove=False,  # Keep container for inspection
+            container_name = (
+                f"{self.config.container_name}-{os.getpid()}-{next(_NAME_COUNTER)}"
+            )
+
+            # Create container
+            logger.info(f"Starting container {container_name}")
+            transport = get_docker_transport()
+            container_id = self._create_container(
+                client, transport, container_name, host_port, volumes, environment
+            )
+            self.container = client.containers.prepare_model({"Id": container_id})
+            self._status_cache = None
+
+            # Subscribe before starting so the start event cannot be missed
+            events = client.events(
+                decode=True,
+                filters={"type": "container", "container": container_id},
+                since=int(time.time()),
             )
+            try:
+                if transport is not None:
+                    transport.start_container(container_id)
+                else:
+                    client.api.start(container_id)
+
+                # Wait for container to be ready
+                self._wait_for_ready(events)
+            finally:
+                events.close()
 
-            # Wait for container to be ready
-            self._wait_for_ready()
+            self.port = host_port or self._read_host_port()
+            # The published port is only on localhost when the engine is local
+            if self._is_local_engine(client) and not self._probe_port():
+                logger.warning(
+                    f"Container {container_name} is running but port {self.port} "
+                    "is not accepting connections yet"
+                )
 
-            logger.info(f"Container {container_name} started successfully")
+            logger.info(f"Container {container_name} started on port {self.port}")
             return self.get_connection_string()
 
+        except Exception as e:
+            # Any failure after mkdtemp/create must not leak the container or dirs
+            self._discard_container()
+            self._remove_host_dirs()
+            self.port = None
+            self._status_cache = None
+            if isinstance(e, DockerException):
+                raise ContainerError(f"Failed to start container: {e}") from e
+            raise
+
+    def _create_container(
+        self,
+        client: docker.DockerClient,
+        transport: Optional[UdsHttpClient],
+        name: str,
+        host_port: Optional[int],
+        volumes: dict,
+        environment: dict,
+    ) -> str:
+        """Create (but do not start) the DuckDB container and return its ID."""
+        host_config = client.api.create_host_config(
+            port_bindings={3141: host_port},  # DuckDB default HTTP port
+            binds=volumes,
+            # Docker removes the container on exit unless kept for inspection
+            auto_remove=not self.config.keep_for_inspection,
+        )
+        body = client.api.create_container_config(
+            self.config.container_image,
+            None,
+            detach=True,
+            ports=[3141],
+            environment=environment or None,
+            host_config=host_config,
+        )
+
+        for attempt in range(2):
+            try:
+                if transport is not None:
+                    return transport.create_container(name, body)
+                return client.api.create_container_from_config(body, name)["Id"]
+            except NotFound:
+                if attempt:
+                    raise
+                # Image not available locally; pull it like containers.run() does
+                logger.info(f"Pulling image {self.config.container_image}")
+                client.images.pull(self.config.container_image)
+
+    def _discard_container(self) -> None:
+        """Best-effort removal of a container that failed to start."""
+        if not self.container:
+            return
+        try:
+            self.container.remove(force=True)
         except DockerException as e:
-            raise ContainerError(f"Failed to start container: {e}") from e
+            logger.debug(f"Could not remove container {self.container.id}: {e}")
+        self.container = None
+
+    def _watch_events(self, events, container_id: str) -> None:
+        """Consume the Docker event stream until the container reports ready."""
+        try:
+            for event in events:
+                status = event.get("status") or event.get("Action")
+                if event.get("Actor", {}).get("ID") == container_id and status in _READY_EVENTS:
+                    self._ready_from_events = True
+                    return
+        except Exception as e:
+            logger.debug(f"Docker event stream failed: {e}")
+        finally:
+            self._ready_event.set()
 
-    def _wait_for_ready(self, timeout: int = 30) -> None:
+    def _wait_for_ready(self, events, timeout: int = 30) -> None:
         """Wait for container to be ready."""
         if not self.container:
             raise ContainerError("Container not initialized")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            self.container.reload()
-            if self.container.status == "running":
-                # Simple health check - container is running
-                # TODO: Add actual DuckDB health check
-                time.sleep(1)  # Give it a moment to fully start
-                return
-            time.sleep(0.5)
-
-        raise ContainerError(
-            f"Container did not become ready within {timeout} seconds"
+        self._ready_event.clear()
+        self._ready_from_events = False
+        watcher = threading.Thread(
+            target=self._watch_events,
+            args=(events, self.container.id),
+            daemon=True,
         )
+        watcher.start()
+
+        if not self._ready_event.wait(timeout):
+            raise ContainerError(
+                f"Container did not become ready within {timeout} seconds"
+            )
+        if self._ready_from_events:
+            return
+
+        # Event stream ended without a match; fall back to a single status check
+        if self._reload() != "running":
+            raise ContainerError(
+                f"Container is not running (status: {self.container.status})"
+            )
+
+    def _probe_port(self) -> bool:
+        """Check that the DuckDB port accepts TCP connections."""
+        for _ in range(_PROBE_ATTEMPTS):
+            try:
+                with socket.create_connection(("localhost", self.port), timeout=_PROBE_TIMEOUT):
+                    return True
+            except OSError:
+                time.sleep(_PROBE_INTERVAL)
+        return False
 
     def stop(self) -> None:
-        """Stop and remove container."""
+        """Stop container; Docker removes it unless kept for inspection."""
         if not self.container:
             return
 
         try:
             container_id = self.container.id
             logger.info(f"Stopping container {container_id}")
-            self.container.stop()
-            self.container.remove()
-            logger.info(f"Container {container_id} stopped and removed")
+            transport = get_docker_transport()
+            if transport is not None and not self.config.keep_for_inspection:
+                # Force-remove kills and deletes the container in one call
+                transport.remove_container(container_id)
+            else:
+                # Ephemeral instance: skip the SIGTERM grace period
+                self.container.stop(timeout=0)
+            logger.info(f"Container {container_id} stopped")
         except DockerException as e:
             logger.warning(f"Error stopping container: {e}")
             raise ContainerError(f"Failed to stop container: {e}") from e
         finally:
             self.container = None
             self.port = None
+            self._status_cache = None
+            self._remove_host_dirs()
+
+    def _remove_host_dirs(self) -> None:
+        """Delete the per-container data and socket directories from the host."""
+        for path in (self.data_dir, self.socket_dir):
+            if path:
+                shutil.rmtree(path, ignore_errors=True)
+        self.data_dir = None
+        self.socket_dir = None
 
     def is_running(self) -> bool:
         """Check if container is running."""
         if not self.container:
             return False
 
+        if self._status_cache is not None:
+            cached_at, status = self._status_cache
+            if time.monotonic() - cached_at < _STATUS_CACHE_TTL:
+                return status == "running"
+
         try:
-            self.container.reload()
-            return self.container.status == "running"
+            return self._reload() == "running"
         except DockerException:
             return False
 
@@ -149,9 +405,29 @@ class ContainerManager:
         Get connection string for DuckDB instance.
 
         Returns:
-            Connection string (format: duckdb://localhost:PORT)
+            Connection string (format: duckdb+unix:///PATH/duckdb.sock once
+            the container listens on the shared socket, otherwise
+            duckdb://localhost:PORT)
         """
+        if self.socket_dir:
+            socket_path = os.path.join(self.socket_dir, _SOCKET_FILE)
+            try:
+                if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                    return f"duckdb+unix://{socket_path}"
+            except OSError:
+                pass
         if not self.port:
             raise ContainerError("Container not started or port not assigned")
         return f"duckdb://localhost:{self.port}"
 
+    def get_database_path(self) -> str:
+        """
+        Get host path of the database file in the container's data volume.
+
+        Returns:
+            Absolute path to the DuckDB database file
+        """
+        if not self.data_dir:
+            raise ContainerError("Container not started or data volume not created")
+        return os.path.join(self.data_dir, _DATABASE_FILE)
+
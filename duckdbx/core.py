@@ -1,24 +1,181 @@
 """Main DuckDBX class for managing ephemeral DuckDB instances."""
 
+import functools
 import logging
-from typing import Optional, Any
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Any, Callable, List, Literal, Tuple
 import duckdb
 
 from duckdbx.exceptions import DuckDBConnectionError, ContainerError
 from duckdbx.config import Config
-from duckdbx.container import ContainerManager
+from duckdbx.container import ContainerManager, docker_cpu_count
+
+if TYPE_CHECKING:
+    from duckdbx.pool import ContainerPool
 
 logger = logging.getLogger(__name__)
 
+# INSERT ... VALUES (?, ?, ...) statements eligible for Arrow bulk loading
+_BULK_INSERT_RE = re.compile(
+    r"^\s*INSERT\s+INTO\s+(?P<table>[\w.\"]+)\s*(?P<columns>\([^)]*\))?\s*"
+    r"VALUES\s*\((?P<values>\s*\?(?:\s*,\s*\?)*\s*)\)\s*;?\s*$",
+    re.IGNORECASE,
+)
+_BULK_VIEW = "__duckdbx_bulk"
+# Minimum number of rows before bulk inserts go through Arrow
+_ARROW_BULK_THRESHOLD = 1000
+# Seconds to wait for a pooled cursor when all are checked out
+_CURSOR_WAIT_TIMEOUT = 30
+
+ReturnFormat = Literal["tuples", "arrow", "numpy", "df"]
+_RETURN_FORMATS = ("tuples", "arrow", "numpy", "df")
+# fetch_arrow_table() is deprecated in favour of to_arrow_table() in newer DuckDB
+_FETCH_ARROW = (
+    "to_arrow_table"
+    if hasattr(duckdb.DuckDBPyConnection, "to_arrow_table")
+    else "fetch_arrow_table"
+)
+
+
+def _bulk_insert_plan(sql: str) -> Optional[Tuple[str, int]]:
+    """
+    Parse an INSERT ... VALUES (?, ...) statement for Arrow bulk loading.
+
+    Returns:
+        The equivalent INSERT ... SELECT over the registered Arrow table and
+        the number of placeholders, or None if the statement is not eligible
+    """
+    match = _BULK_INSERT_RE.match(sql)
+    if not match:
+        return None
+    columns = f" {match.group('columns')}" if match.group("columns") else ""
+    rewritten = f"INSERT INTO {match.group('table')}{columns} SELECT * FROM {_BULK_VIEW}"
+    return rewritten, match.group("values").count("?")
+
+
+# Cursor methods that read the whole result, after which the cursor is free.
+# Streaming readers (arrow(), fetch_record_batch(), ...) keep it until close().
+_TERMINAL_FETCHES = frozenset({"fetchdf", "fetch_df", "fetch_arrow_table", "pl", "tf", "torch"})
+
+
+class ExecuteResult:
+    """
+    Result of DuckDBX.execute().
+
+    Holds its pooled cursor until the result has been read, so no other
+    statement can run on that cursor first. The cursor goes back to the pool
+    after fetchall()/fetchnumpy()/df()/to_arrow_table() (and the other
+    whole-result fetches such as fetchdf() or pl()), once fetchone() or
+    fetchmany() run out of rows, on close(), or when the result is dropped.
+    Unread results keep their cursor checked out.
+
+    Other cursor attributes are forwarded, so streaming readers like arrow()
+    or fetch_record_batch() work too; they keep the cursor until close().
+    """
+
+    def __init__(self, cursor: duckdb.DuckDBPyConnection, release: Callable[[Any], None]):
+        self._cursor: Optional[duckdb.DuckDBPyConnection] = cursor
+        self._release = release
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Return the cursor to the pool without reading remaining rows."""
+        cursor, self._cursor = self._cursor, None
+        if cursor is not None:
+            self._release(cursor)
+
+    @property
+    def description(self) -> Any:
+        """Column description of the result (DB-API style)."""
+        return self._active().description
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._active(), name)
+        if name in _TERMINAL_FETCHES:
+            return functools.partial(self._fetch, name)
+        return attr
+
+    def _active(self) -> duckdb.DuckDBPyConnection:
+        if self._cursor is None:
+            raise DuckDBConnectionError("Result has already been consumed or closed")
+        return self._cursor
+
+    def _fetch(
+        self,
+        method: str,
+        *args: Any,
+        exhausted: Optional[Callable[[Any], bool]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        cursor = self._active()
+        try:
+            result = getattr(cursor, method)(*args, **kwargs)
+        except duckdb.Error as e:
+            self.close()
+            raise DuckDBConnectionError(f"Fetching results failed: {e}") from e
+        if exhausted is None or exhausted(result):
+            self.close()
+        return result
+
+    def fetchall(self) -> list:
+        """Fetch all remaining rows as tuples."""
+        return self._fetch("fetchall")
+
+    def fetchone(self) -> Optional[tuple]:
+        """Fetch the next row, or None when no rows remain."""
+        return self._fetch("fetchone", exhausted=lambda row: row is None)
+
+    def fetchmany(self, size: int = 1) -> list:
+        """Fetch up to size rows; an empty list means no rows remain."""
+        return self._fetch("fetchmany", size, exhausted=lambda rows: not rows)
+
+    def fetchnumpy(self) -> Any:
+        """Fetch all remaining rows as a dict of NumPy arrays."""
+        return self._fetch("fetchnumpy")
+
+    def df(self) -> Any:
+        """Fetch all remaining rows as a pandas DataFrame."""
+        return self._fetch("df")
+
+    def to_arrow_table(self) -> Any:
+        """Fetch all remaining rows as a pyarrow.Table."""
+        return self._fetch(_FETCH_ARROW)
+
 
 class DuckDBX:
-    """Main class for managing ephemeral DuckDB instances in Docker."""
+    """
+    Main class for managing ephemeral DuckDB instances in Docker.
+
+    Statements run on a bounded pool of cursors over a single connection, so
+    concurrent callers do not serialize on one connection lock. Temporary
+    tables, prepared statements and other session state are per-cursor and
+    are not guaranteed to be visible to later calls.
+    """
 
     def __init__(
         self,
         container_image: Optional[str] = None,
         container_name: Optional[str] = None,
         port: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        keep_for_inspection: Optional[bool] = None,
+        preload_extensions: Optional[List[str]] = None,
+        unix_socket: Optional[bool] = None,
+        pool: Optional["ContainerPool"] = None,
     ):
         """
         Initialize DuckDBX instance.
@@ -27,17 +184,42 @@ class DuckDBX:
             container_image: Docker image name for DuckDB container
             container_name: Container name prefix
             port: Port number for DuckDB connection (auto-assigned if None)
+            pool_size: Maximum number of pooled DuckDB cursors (default 4)
+            keep_for_inspection: Keep the container after stop() instead of
+                removing it
+            preload_extensions: DuckDB extensions to load when the host-side
+                connection is opened; missing ones are installed first
+            unix_socket: Experimental; share a Unix socket directory with the
+                container when the Docker engine runs natively on this host.
+                The current image does not listen on it and queries still use
+                the database file, so this only adds start-up cost for now
+            pool: Container pool to take a pre-started container from
+                instead of starting a new one
         """
-        self.config = Config(
-            container_image=container_image,
-            container_name=container_name,
-            port=port,
-        )
-        self.config.validate()
+        params = {
+            "container_image": container_image,
+            "container_name": container_name,
+            "port": port,
+            "pool_size": pool_size,
+            "keep_for_inspection": keep_for_inspection,
+            "preload_extensions": preload_extensions,
+            "unix_socket": unix_socket,
+        }
+        if any(value is not None for value in params.values()):
+            self.config = Config(**params)
+            self.config.validate()
+        else:
+            # Common zero-argument case: reuse the defaults validated at import
+            self.config = Config.validated_default()
 
         self.container_manager = ContainerManager(self.config)
+        self._pool = pool
         self.connection: Optional[duckdb.DuckDBPyConnection] = None
         self._started = False
+        self._cursor_pool: "queue.Queue[duckdb.DuckDBPyConnection]" = queue.Queue()
+        self._cursors_created = 0
+        self._cursor_generation = 0
+        self._pool_lock = threading.Lock()
 
     def __enter__(self):
         """Context manager entry."""
@@ -56,25 +238,97 @@ class DuckDBX:
             return
 
         try:
-            # Start container
-            connection_string = self.container_manager.start()
-            logger.info(f"Container started: {connection_string}")
-
-            # For now, we'll use a local DuckDB connection
-            # In the future, this will connect to the containerized instance
-            # For bare bones setup, we'll create a local connection
-            # that will be replaced with container connection later
-            self.connection = duckdb.connect(":memory:")
+            # Start container; the DuckDB connection is opened on first use
+            if self._pool is not None:
+                self.container_manager = self._pool.acquire()
+                connection_string = self.container_manager.get_connection_string()
+            else:
+                connection_string = self.container_manager.start()
             self._started = True
-            logger.info("DuckDB connection established")
+            logger.info(f"Container started: {connection_string}")
 
         except ContainerError as e:
             logger.error(f"Failed to start container: {e}")
             raise
-        except Exception as e:
-            logger.error(f"Failed to establish connection: {e}")
-            self.stop()  # Cleanup on error
-            raise DuckDBConnectionError(f"Failed to start DuckDBX: {e}") from e
+
+    def _ensure_connection(self) -> duckdb.DuckDBPyConnection:
+        """Open the connection to the container's database on first use."""
+        if self.connection is None:
+            # No network transport to the container yet; use the database
+            # file in the container's shared data volume
+            try:
+                connection = duckdb.connect(self.container_manager.get_database_path())
+            except (duckdb.Error, ContainerError) as e:
+                raise DuckDBConnectionError(f"Failed to connect to DuckDB: {e}") from e
+
+            try:
+                for ext in self.config.preload_extensions:
+                    self._load_extension(connection, ext)
+            except duckdb.Error as e:
+                connection.close()
+                raise DuckDBConnectionError(f"Failed to load extension: {e}") from e
+            self.connection = connection
+            logger.info("DuckDB connection established")
+        return self.connection
+
+    @staticmethod
+    def _load_extension(connection: duckdb.DuckDBPyConnection, ext: str) -> None:
+        """Load an extension into the host connection, installing it if needed."""
+        try:
+            connection.execute(f"LOAD {ext}")
+        except duckdb.Error:
+            # Not built in or cached yet; INSTALL may download it
+            connection.execute(f"INSTALL {ext}")
+            connection.execute(f"LOAD {ext}")
+
+    def _checkout_cursor(self) -> duckdb.DuckDBPyConnection:
+        """Take a cursor from the pool, creating one if the pool is not full."""
+        try:
+            return self._cursor_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if self._cursors_created < self.config.pool_size:
+                cursor = self._ensure_connection().cursor()
+                self._cursors_created += 1
+                return cursor
+
+        try:
+            return self._cursor_pool.get(timeout=_CURSOR_WAIT_TIMEOUT)
+        except queue.Empty:
+            raise DuckDBConnectionError(
+                f"All {self.config.pool_size} pooled cursors are in use and none was "
+                f"returned within {_CURSOR_WAIT_TIMEOUT} seconds; read or close() "
+                "earlier ExecuteResults before running more statements"
+            ) from None
+
+    def _close_cursors(self) -> None:
+        """Close every pooled cursor."""
+        with self._pool_lock:
+            while True:
+                try:
+                    self._cursor_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._cursors_created = 0
+            self._cursor_generation += 1
+
+    def _releaser(self) -> Callable[[duckdb.DuckDBPyConnection], None]:
+        """Build a callback returning a cursor to the current pool generation."""
+        generation = self._cursor_generation
+
+        def release(cursor: duckdb.DuckDBPyConnection) -> None:
+            if generation == self._cursor_generation:
+                self._cursor_pool.put(cursor)
+            else:
+                # Instance was stopped while the result was outstanding
+                try:
+                    cursor.close()
+                except duckdb.Error:
+                    pass
+
+        return release
 
     def stop(self) -> None:
         """Stop the DuckDB container and close connection."""
@@ -82,11 +336,16 @@ class DuckDBX:
             return
 
         try:
+            self._close_cursors()
             if self.connection:
                 self.connection.close()
                 self.connection = None
 
-            self.container_manager.stop()
+            if self._pool is not None:
+                self._pool.release(self.container_manager)
+                self.container_manager = ContainerManager(self.config)
+            else:
+                self.container_manager.stop()
             self._started = False
             logger.info("DuckDBX instance stopped")
 
@@ -97,7 +356,36 @@ class DuckDBX:
         """Check if the instance is running."""
         return self._started and self.container_manager.is_running()
 
-    def execute(self, sql: str, parameters: Optional[list] = None) -> Any:
+    def _execute_many(self, cursor: duckdb.DuckDBPyConnection, sql: str, rows: list) -> Any:
+        """
+        Execute a statement once per parameter row.
+
+        Large ``INSERT INTO t VALUES (?, ...)`` batches are loaded as a single
+        Arrow table; everything else goes through ``executemany``.
+        """
+        plan = _bulk_insert_plan(sql) if len(rows) >= _ARROW_BULK_THRESHOLD else None
+        if plan is not None:
+            rewritten, width = plan
+            if all(len(row) == width for row in rows):
+                import pyarrow as pa
+
+                try:
+                    table = pa.Table.from_arrays(
+                        [pa.array(column) for column in zip(*rows)],
+                        names=[f"col{i}" for i in range(width)],
+                    )
+                except pa.ArrowException as e:
+                    logger.debug(f"Arrow bulk load unavailable, using executemany: {e}")
+                else:
+                    cursor.register(_BULK_VIEW, table)
+                    try:
+                        return cursor.execute(rewritten)
+                    finally:
+                        cursor.unregister(_BULK_VIEW)
+
+        return cursor.executemany(sql, rows)
+
+    def execute(self, sql: str, parameters: Optional[list] = None) -> "ExecuteResult":
         """
         Execute SQL statement.
 
@@ -106,38 +394,120 @@ class DuckDBX:
             parameters: Optional parameters for parameterized queries
 
         Returns:
-            Cursor object
+            ExecuteResult holding the cursor until its rows are fetched
+        """
+        if parameters:
+            return self._run(lambda cursor: cursor.execute(sql, parameters))
+        return self._run(lambda cursor: cursor.execute(sql))
+
+    def execute_many(self, sql: str, rows: list) -> "ExecuteResult":
         """
-        if not self._started or not self.connection:
+        Execute a parameterized statement once per row of parameters.
+
+        Args:
+            sql: SQL statement to execute
+            rows: Sequence of parameter lists/tuples, one per execution
+
+        Returns:
+            ExecuteResult holding the cursor until its rows are fetched
+        """
+        return self._run(lambda cursor: self._execute_many(cursor, sql, rows))
+
+    def _run(self, statement: Callable[[duckdb.DuckDBPyConnection], Any]) -> "ExecuteResult":
+        """Run a statement on a pooled cursor and wrap the cursor as a result."""
+        if not self._started:
             raise DuckDBConnectionError("DuckDBX instance not started")
+        release = self._releaser()
+        cursor = self._checkout_cursor()
 
         try:
-            if parameters:
-                return self.connection.execute(sql, parameters)
-            else:
-                return self.connection.execute(sql)
-        except Exception as e:
+            statement(cursor)
+        except duckdb.Error as e:
+            release(cursor)
             raise DuckDBConnectionError(f"Query execution failed: {e}") from e
+        except BaseException:
+            release(cursor)
+            raise
+        return ExecuteResult(cursor, release)
 
-    def query(self, sql: str, parameters: Optional[list] = None) -> Any:
+    def query(
+        self,
+        sql: str,
+        parameters: Optional[list] = None,
+        return_format: ReturnFormat = "arrow",
+    ) -> Any:
         """
         Execute SQL query and return results.
 
         Args:
             sql: SQL query to execute
             parameters: Optional parameters for parameterized queries
+            return_format: Result format: "arrow" (pyarrow.Table, default),
+                "numpy" (dict of NumPy arrays), "df" (pandas DataFrame) or
+                "tuples" (list of tuples)
 
         Returns:
-            Query results (can be converted to DataFrame)
+            Query results in the requested format
         """
-        if not self._started or not self.connection:
+        if return_format not in _RETURN_FORMATS:
+            raise ValueError(
+                f"return_format must be one of {_RETURN_FORMATS}, got {return_format!r}"
+            )
+        if not self._started:
             raise DuckDBConnectionError("DuckDBX instance not started")
+        release = self._releaser()
+        cursor = self._checkout_cursor()
 
         try:
             if parameters:
-                return self.connection.execute(sql, parameters).fetchall()
+                result = cursor.execute(sql, parameters)
             else:
-                return self.connection.execute(sql).fetchall()
-        except Exception as e:
+                result = cursor.execute(sql)
+
+            if return_format == "arrow":
+                return getattr(result, _FETCH_ARROW)()
+            if return_format == "numpy":
+                return result.fetchnumpy()
+            if return_format == "df":
+                return result.df()
+            return result.fetchall()
+        except duckdb.Error as e:
             raise DuckDBConnectionError(f"Query execution failed: {e}") from e
+        finally:
+            release(cursor)
+
+
+def start_many(configs: List[Config], max_workers: int = 8) -> List[DuckDBX]:
+    """
+    Start several DuckDBX instances concurrently.
+
+    Container startup is mostly waiting on the Docker daemon, so starts are
+    overlapped in a thread pool sized by max_workers, the number of configs
+    and the Docker engine's CPU count.
+
+    Args:
+        configs: One configuration per instance
+        max_workers: Upper bound on concurrent starts
+
+    Returns:
+        Started instances, in the same order as configs
+    """
+    instances = [DuckDBX(**config.to_dict()) for config in configs]
+    if not instances:
+        return instances
+
+    workers = min(max_workers, len(instances))
+    ncpu = docker_cpu_count()
+    if ncpu:
+        workers = min(workers, ncpu)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = [executor.submit(instance.start) for instance in instances]
+        errors = [future.exception() for future in futures]
 
+    failed = next((e for e in errors if e is not None), None)
+    if failed is not None:
+        for instance in instances:
+            instance.stop()
+        raise failed
+    return instances
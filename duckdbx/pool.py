@@ -0,0 +1,143 @@
+"""Pool of pre-started DuckDB containers."""
+
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+from duckdbx.exceptions import ContainerError, ConfigurationError
+from duckdbx.config import Config
+from duckdbx.container import ContainerManager
+
+logger = logging.getLogger(__name__)
+
+
+class ContainerPool:
+    """
+    Keeps a number of DuckDB containers started and ready to hand out.
+
+    Containers are never reused: a released container is stopped and a
+    replacement is started in the background, so every checkout gets a
+    fresh, empty instance.
+    """
+
+    def __init__(self, size: int = 4, config: Optional[Config] = None):
+        """
+        Initialize the pool and start warming containers.
+
+        Args:
+            size: Number of containers to keep ready
+            config: Configuration used for every pooled container
+        """
+        if size < 1:
+            raise ConfigurationError("size must be at least 1")
+
+        self.size = size
+        if config is not None:
+            config.validate()
+            self.config = config
+        else:
+            self.config = Config.validated_default()
+
+        self._idle: "queue.Queue[Union[ContainerManager, ContainerError]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="duckdbx-pool"
+        )
+        self._closed = False
+
+        for _ in range(size):
+            self._executor.submit(self._spawn)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit with cleanup."""
+        self.close()
+        return False
+
+    def _spawn(self) -> None:
+        """Start one container and park it in the idle queue."""
+        manager = ContainerManager(self.config)
+        try:
+            manager.start()
+        except Exception as e:
+            # Hand every failure to a waiting acquire(); the executor would
+            # otherwise swallow it and leave acquire() blocked
+            logger.warning(f"Failed to start pooled container: {e}")
+            if not isinstance(e, ContainerError):
+                error = ContainerError(f"Failed to start pooled container: {e}")
+                error.__cause__ = e
+                e = error
+            self._idle.put(e)
+            return
+
+        if self._closed:
+            self._stop(manager)
+            return
+        self._idle.put(manager)
+
+    @staticmethod
+    def _stop(manager: ContainerManager) -> None:
+        """Stop a container, logging rather than raising on failure."""
+        try:
+            manager.stop()
+        except ContainerError as e:
+            logger.warning(f"Failed to stop pooled container: {e}")
+
+    def acquire(self, timeout: Optional[float] = None) -> ContainerManager:
+        """
+        Take a started container from the pool.
+
+        Args:
+            timeout: Seconds to wait for a container (wait forever if None)
+
+        Returns:
+            Started container manager
+        """
+        if self._closed:
+            raise ContainerError("Container pool is closed")
+
+        try:
+            item = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise ContainerError(
+                f"No pooled container became available within {timeout} seconds"
+            )
+
+        # Replace what was taken so the pool stays warm
+        self._executor.submit(self._spawn)
+
+        if isinstance(item, ContainerError):
+            raise item
+        return item
+
+    def release(self, manager: ContainerManager) -> None:
+        """
+        Return a container to the pool; it is stopped in the background.
+
+        Args:
+            manager: Container manager obtained from acquire()
+        """
+        if self._closed:
+            self._stop(manager)
+            return
+        self._executor.submit(self._stop, manager)
+
+    def close(self) -> None:
+        """Stop all idle containers and shut down the pool."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, ContainerManager):
+                self._stop(item)
+        logger.info("Container pool closed")
@@ -6,6 +6,7 @@ This script demonstrates:
 1. Starting a DuckDB container
 2. Running a simple query
 3. Stopping the container
+4. Starting several containers concurrently
 
 Usage:
     python examples/basic_test.py
@@ -13,11 +14,12 @@ Usage:
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import duckdbx
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from duckdbx import DuckDBX
+from duckdbx import Config, DuckDBX, start_many
 
 
 def test_context_manager():
@@ -29,11 +31,11 @@ def test_context_manager():
         
         # Run a simple query
         result = db.query("SELECT 1 as test_value, 'Hello DuckDBX' as message")
-        print(f"✓ Query result: {result}")
+        print(f"✓ Query result: {result.to_pylist()}")
         
         # Run another query
         result = db.query("SELECT 2 + 2 as sum")
-        print(f"✓ Query result: {result}")
+        print(f"✓ Query result: {result.to_pylist()}")
     
     print("✓ Context manager cleanup completed")
 
@@ -50,21 +52,40 @@ def test_manual_lifecycle():
         
         # Run a query
         result = db.query("SELECT 'Manual lifecycle test' as test")
-        print(f"✓ Query result: {result}")
+        print(f"✓ Query result: {result.to_pylist()}")
         
     finally:
         db.stop()
         print("✓ Manual cleanup completed")
 
 
+def test_start_many():
+    """Test starting several instances concurrently."""
+    print("\nTesting concurrent startup...")
+
+    instances = start_many([Config(), Config()])
+
+    try:
+        for i, db in enumerate(instances):
+            result = db.query(f"SELECT {i} as instance")
+            print(f"✓ Instance {i} query result: {result.to_pylist()}")
+    finally:
+        for db in instances:
+            db.stop()
+        print("✓ Concurrent cleanup completed")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("DuckDBX Basic Test")
     print("=" * 60)
     
     try:
-        test_context_manager()
-        test_manual_lifecycle()
+        # Container startup is mostly waiting on Docker, so run tests concurrently
+        tests = [test_context_manager, test_manual_lifecycle, test_start_many]
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            for future in [executor.submit(test) for test in tests]:
+                future.result()
         
         print("\n" + "=" * 60)
         print("✓ All tests passed!")
@@ -0,0 +1,72 @@
+"""Tests for configuration loading."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from duckdbx.config import Config
+from duckdbx.exceptions import ConfigurationError
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Set environment variables and re-snapshot the config defaults."""
+
+    def set_env(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(name, value)
+        Config.refresh_env()
+
+    yield set_env
+    monkeypatch.undo()
+    Config.refresh_env()
+
+
+def test_invalid_env_int_does_not_break_import():
+    result = subprocess.run(
+        [sys.executable, "-c", "import duckdbx; print(duckdbx.__version__)"],
+        env={"DUCKDBX_PORT": "abc", "PYTHONPATH": REPO_ROOT},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_invalid_env_int_raises_on_use(env):
+    env(DUCKDBX_POOL_SIZE="many")
+
+    with pytest.raises(ConfigurationError, match="DUCKDBX_POOL_SIZE"):
+        Config()
+    with pytest.raises(ConfigurationError, match="DUCKDBX_POOL_SIZE"):
+        Config.validated_default()
+
+
+def test_explicit_param_overrides_invalid_env(env):
+    env(DUCKDBX_PORT="abc")
+
+    assert Config(port=5000).port == 5000
+
+
+def test_validated_default_is_read_only():
+    config = Config.validated_default()
+
+    with pytest.raises(AttributeError):
+        config.pool_size = 1
+    assert isinstance(config.preload_extensions, tuple)
+
+    custom = Config()
+    custom.pool_size = 1
+    assert custom.pool_size == 1
+
+
+def test_explicit_zero_pool_size_is_rejected():
+    config = Config(pool_size=0)
+
+    assert config.pool_size == 0
+    with pytest.raises(ConfigurationError, match="pool_size"):
+        config.validate()
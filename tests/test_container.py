@@ -0,0 +1,39 @@
+"""Tests for container lifecycle handling, with the Docker client mocked."""
+
+from unittest import mock
+
+import pytest
+
+from duckdbx import container
+from duckdbx.config import Config
+from duckdbx.container import ContainerManager
+from duckdbx.exceptions import ContainerError
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A mock Docker client installed as the shared client, with no transport."""
+    client = mock.Mock()
+    client.api.base_url = "http+docker://localhost"
+    client.api.create_container_from_config.return_value = {"Id": "abc123"}
+    monkeypatch.setattr(container, "get_docker_client", lambda: client)
+    monkeypatch.setattr(container, "get_docker_transport", lambda: None)
+    return client
+
+
+def test_start_cleans_up_when_container_never_becomes_ready(client, monkeypatch, tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(container.tempfile, "mkdtemp", lambda prefix: str(data_dir))
+    manager = ContainerManager(Config())
+    monkeypatch.setattr(
+        manager, "_wait_for_ready", mock.Mock(side_effect=ContainerError("not ready"))
+    )
+
+    with pytest.raises(ContainerError, match="not ready"):
+        manager.start()
+
+    client.containers.prepare_model.return_value.remove.assert_called_once_with(force=True)
+    assert manager.container is None
+    assert manager.data_dir is None
+    assert not data_dir.exists()
@@ -0,0 +1,201 @@
+"""Tests for DuckDBX query execution, without Docker."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import duckdb
+import pytest
+
+from duckdbx import core
+from duckdbx.core import DuckDBX, _ARROW_BULK_THRESHOLD, _bulk_insert_plan
+from duckdbx.exceptions import DuckDBConnectionError
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A started DuckDBX whose container manager is replaced by a mock."""
+    instance = DuckDBX(pool_size=4)
+    manager = mock.Mock()
+    manager.start.return_value = "duckdb://localhost:0"
+    manager.get_database_path.return_value = str(tmp_path / "duckdb.db")
+    instance.container_manager = manager
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+def test_execute_result_survives_concurrent_statements(db):
+    def run(i):
+        return db.execute(f"SELECT {i} AS value, range FROM range(100)").fetchall()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(run, range(200)))
+
+    for i, rows in enumerate(results):
+        assert rows == [(i, n) for n in range(100)]
+
+
+def test_execute_result_holds_cursor_until_read(db):
+    first = db.execute("SELECT 1")
+    second = db.execute("SELECT 2")
+
+    assert second.fetchall() == [(2,)]
+    assert first.fetchall() == [(1,)]
+    assert db._cursor_pool.qsize() == 2
+
+
+def test_execute_result_releases_cursor_when_exhausted(db):
+    result = db.execute("SELECT * FROM range(2)")
+
+    assert result.fetchone() == (0,)
+    assert db._cursor_pool.qsize() == 0
+    assert result.fetchone() == (1,)
+    assert result.fetchone() is None
+    assert db._cursor_pool.qsize() == 1
+
+    with pytest.raises(DuckDBConnectionError):
+        result.fetchall()
+
+
+def test_execute_error_returns_cursor(db):
+    with pytest.raises(DuckDBConnectionError):
+        db.execute("SELECT * FROM missing_table")
+
+    assert db._cursor_pool.qsize() == 1
+
+
+def test_bulk_insert_plan_without_column_list():
+    assert _bulk_insert_plan("INSERT INTO t VALUES (?, ?)") == (
+        "INSERT INTO t SELECT * FROM __duckdbx_bulk",
+        2,
+    )
+
+
+def test_bulk_insert_plan_with_column_list():
+    assert _bulk_insert_plan("insert into s.t (a, b) values (?,?);") == (
+        "INSERT INTO s.t (a, b) SELECT * FROM __duckdbx_bulk",
+        2,
+    )
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "INSERT INTO t VALUES (?, 1)",
+        "INSERT INTO t SELECT ?",
+        "UPDATE t SET a = ?",
+        "INSERT INTO t VALUES (?), (?)",
+    ],
+)
+def test_bulk_insert_plan_rejects_other_statements(sql):
+    assert _bulk_insert_plan(sql) is None
+
+
+@pytest.mark.parametrize(
+    "sql",
+    ["INSERT INTO t VALUES (?, ?)", "INSERT INTO t (b, a) VALUES (?, ?)"],
+)
+def test_execute_many_bulk_insert(db, sql):
+    db.execute("CREATE TABLE t (a INTEGER, b VARCHAR)")
+    if "(b, a)" in sql:
+        rows = [(str(i), i) for i in range(_ARROW_BULK_THRESHOLD)]
+    else:
+        rows = [(i, str(i)) for i in range(_ARROW_BULK_THRESHOLD)]
+
+    db.execute_many(sql, rows).close()
+
+    result = db.query("SELECT a, b FROM t ORDER BY a", return_format="tuples")
+    assert result == [(i, str(i)) for i in range(_ARROW_BULK_THRESHOLD)]
+
+
+def test_execute_many_small_batch(db):
+    db.execute("CREATE TABLE t (a INTEGER)")
+
+    db.execute_many("INSERT INTO t VALUES (?)", [(1,), (2,)]).close()
+
+    assert db.query("SELECT sum(a) FROM t", return_format="tuples") == [(3,)]
+
+
+def test_execute_list_parameter_is_one_row(db):
+    db.execute("CREATE TABLE t (a INTEGER[])")
+
+    db.execute("INSERT INTO t VALUES (?)", [[1, 2, 3]]).close()
+
+    assert db.query("SELECT a FROM t", return_format="tuples") == [([1, 2, 3],)]
+
+
+def test_preload_extensions_load_on_host_connection(tmp_path):
+    instance = DuckDBX(preload_extensions=["json"])
+    instance.container_manager = mock.Mock()
+    instance.container_manager.get_database_path.return_value = str(tmp_path / "duckdb.db")
+    instance.start()
+    try:
+        assert instance.query(
+            "SELECT loaded FROM duckdb_extensions() WHERE extension_name = 'json'",
+            return_format="tuples",
+        ) == [(True,)]
+    finally:
+        instance.stop()
+
+
+def test_load_extension_installs_when_missing():
+    connection = mock.Mock()
+    connection.execute.side_effect = [duckdb.CatalogException("not found"), None, None]
+
+    DuckDBX._load_extension(connection, "spatial")
+
+    assert [c.args[0] for c in connection.execute.call_args_list] == [
+        "LOAD spatial",
+        "INSTALL spatial",
+        "LOAD spatial",
+    ]
+
+
+def test_checkout_fails_when_unread_results_hold_every_cursor(db, monkeypatch):
+    monkeypatch.setattr(core, "_CURSOR_WAIT_TIMEOUT", 0.05)
+    held = [db.execute(f"SELECT {i}") for i in range(4)]
+
+    with pytest.raises(DuckDBConnectionError, match="pooled cursors are in use"):
+        db.execute("SELECT 5")
+
+    held[0].close()
+    assert db.execute("SELECT 5").fetchall() == [(5,)]
+
+
+def test_execute_result_forwards_cursor_fetches(db):
+    result = db.execute("SELECT 1 AS a")
+
+    assert result.fetchdf()["a"].tolist() == [1]
+    assert db._cursor_pool.qsize() == 1
+
+
+def test_execute_result_streaming_reader_keeps_cursor(db):
+    result = db.execute("SELECT * FROM range(3)")
+
+    # fetch_record_batch() is deprecated in favour of to_arrow_reader() in newer DuckDB
+    if hasattr(duckdb.DuckDBPyConnection, "to_arrow_reader"):
+        reader = result.to_arrow_reader()
+    else:
+        reader = result.fetch_record_batch()
+    assert db._cursor_pool.qsize() == 0
+    assert reader.read_all().num_rows == 3
+    result.close()
+    assert db._cursor_pool.qsize() == 1
+
+
+def test_query_in_flight_during_stop_does_not_return_cursor_to_new_pool(db):
+    cursor = mock.Mock()
+
+    def restart(*args):
+        db.stop()
+        db.start()
+        raise duckdb.InterruptException("interrupted")
+
+    cursor.execute.side_effect = restart
+    with mock.patch.object(db, "_checkout_cursor", return_value=cursor):
+        with pytest.raises(DuckDBConnectionError):
+            db.query("SELECT 1")
+
+    cursor.close.assert_called_once_with()
+    assert db._cursor_pool.qsize() == 0
+    assert db.query("SELECT 1", return_format="tuples") == [(1,)]
@@ -0,0 +1,177 @@
+"""Tests for the Unix-socket Docker API client against a fake daemon."""
+
+import json
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from docker.errors import APIError, DockerException, NotFound
+
+from duckdbx._docker_transport import UdsHttpClient
+
+
+class _FakeDaemonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        server.requests.append((self.command, self.path))
+        if server.slow_requests:
+            # Handle the request but answer after the client has timed out
+            server.slow_requests -= 1
+            time.sleep(0.3)
+
+        status, body = server.routes.get((self.command, self.path), (404, {"message": "no route"}))
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+        # Drop the keep-alive connection without telling the client, like a
+        # daemon closing an idle socket
+        if server.drop_connections:
+            self.close_connection = True
+
+    do_GET = do_POST = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path):
+        super().__init__(path, _FakeDaemonHandler)
+        self.routes = {}
+        self.requests = []
+        self.drop_connections = False
+        self.slow_requests = 0
+
+    def handle_error(self, request, client_address):
+        # Replies to clients that already timed out fail; that is expected
+        pass
+
+
+@pytest.fixture
+def daemon():
+    # Short directory: AF_UNIX paths are limited to ~100 characters
+    directory = tempfile.mkdtemp(prefix="duckdbx-")
+    server = _FakeDaemon(os.path.join(directory, "docker.sock"))
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def client(daemon):
+    client = UdsHttpClient(daemon.server_address, "1.43", timeout=5)
+    yield client
+    client.close()
+
+
+def test_inspect_reuses_connection(daemon, client):
+    daemon.routes[("GET", "/v1.43/containers/abc/json")] = (200, {"Id": "abc"})
+
+    assert client.inspect_container("abc") == {"Id": "abc"}
+    sock = client._connection().sock
+    assert client.inspect_container("abc") == {"Id": "abc"}
+    assert client._connection().sock is sock
+
+
+def test_retries_once_when_idle_connection_was_closed(daemon, client):
+    daemon.routes[("POST", "/v1.43/containers/abc/start")] = (204, None)
+    daemon.drop_connections = True
+
+    client.start_container("abc")
+    client.start_container("abc")
+
+    assert daemon.requests == [("POST", "/v1.43/containers/abc/start")] * 2
+
+
+def test_fresh_connection_failure_raises(tmp_path):
+    client = UdsHttpClient(str(tmp_path / "missing.sock"), "1.43")
+
+    with pytest.raises(DockerException, match="failed"):
+        client.start_container("abc")
+
+
+def test_404_raises_not_found(daemon, client):
+    daemon.routes[("GET", "/v1.43/containers/abc/json")] = (404, {"message": "No such container"})
+
+    with pytest.raises(NotFound, match="No such container"):
+        client.inspect_container("abc")
+
+
+def test_other_errors_raise_api_error(daemon, client):
+    daemon.routes[("POST", "/v1.43/containers/create?name=x")] = (500, {"message": "boom"})
+
+    with pytest.raises(APIError, match="boom") as excinfo:
+        client.create_container("x", {"Image": "duckdbx"})
+    assert not isinstance(excinfo.value, NotFound)
+
+
+@pytest.mark.parametrize("status", [404, 409])
+def test_remove_container_ignores_gone_or_in_progress(daemon, client, status):
+    daemon.routes[("DELETE", "/v1.43/containers/abc?force=1")] = (status, {"message": "gone"})
+
+    client.remove_container("abc")
+
+    assert daemon.requests == [("DELETE", "/v1.43/containers/abc?force=1")]
+
+
+def test_does_not_resend_non_idempotent_request_after_timeout(daemon):
+    daemon.routes[("POST", "/v1.43/containers/abc/start")] = (204, None)
+    daemon.routes[("POST", "/v1.43/containers/create?name=x")] = (201, {"Id": "abc"})
+    client = UdsHttpClient(daemon.server_address, "1.43", timeout=0.1)
+    client.start_container("abc")
+    daemon.slow_requests = 1
+
+    with pytest.raises(DockerException):
+        client.create_container("x", {"Image": "duckdbx"})
+
+    assert daemon.requests.count(("POST", "/v1.43/containers/create?name=x")) == 1
+    client.close()
+
+
+def test_resends_idempotent_request_after_timeout(daemon):
+    daemon.routes[("GET", "/v1.43/containers/abc/json")] = (200, {"Id": "abc"})
+    client = UdsHttpClient(daemon.server_address, "1.43", timeout=0.1)
+    client.inspect_container("abc")
+    daemon.slow_requests = 1
+
+    assert client.inspect_container("abc") == {"Id": "abc"}
+    client.close()
+
+
+def test_close_closes_every_thread_connection(daemon, client):
+    daemon.routes[("GET", "/v1.43/containers/abc/json")] = (200, {"Id": "abc"})
+    connections = []
+
+    def inspect():
+        client.inspect_container("abc")
+        connections.append(client._connection())
+
+    threads = [threading.Thread(target=inspect) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(conn.sock is not None for conn in connections)
+
+    client.close()
+
+    assert all(conn.sock is None for conn in connections)
@@ -0,0 +1,86 @@
+"""Tests for the container pool, with ContainerManager mocked."""
+
+import threading
+from unittest import mock
+
+import pytest
+
+from duckdbx import pool as pool_module
+from duckdbx.config import Config
+from duckdbx.exceptions import ConfigurationError, ContainerError
+from duckdbx.pool import ContainerPool
+
+
+@pytest.fixture
+def manager_class(monkeypatch):
+    """Replace ContainerManager in the pool module with a recording fake."""
+
+    class FakeManager:
+        created = []
+        start_error = None
+        _lock = threading.Lock()
+
+        def __init__(self, config):
+            self.start = mock.Mock(side_effect=FakeManager.start_error)
+            self.stop = mock.Mock()
+            with FakeManager._lock:
+                FakeManager.created.append(self)
+
+    monkeypatch.setattr(pool_module, "ContainerManager", FakeManager)
+    return FakeManager
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ConfigurationError):
+        ContainerPool(size=0)
+
+
+def test_acquire_returns_started_container_and_refills(manager_class):
+    with ContainerPool(size=2, config=Config()) as pool:
+        manager = pool.acquire(timeout=5)
+
+        manager.start.assert_called_once_with()
+        # The other warm container plus the replacement for the one taken
+        idle = [pool._idle.get(timeout=5) for _ in range(2)]
+
+    assert manager not in idle
+    assert len(manager_class.created) == 3
+    assert all(m.start.called for m in manager_class.created)
+
+
+def test_release_stops_container_in_background(manager_class):
+    with ContainerPool(size=1, config=Config()) as pool:
+        manager = pool.acquire(timeout=5)
+        pool.release(manager)
+
+    manager.stop.assert_called_once_with()
+
+
+def test_close_stops_idle_containers(manager_class):
+    pool = ContainerPool(size=2, config=Config())
+    pool.close()
+
+    assert len(manager_class.created) == 2
+    for manager in manager_class.created:
+        manager.stop.assert_called_once_with()
+    with pytest.raises(ContainerError, match="closed"):
+        pool.acquire(timeout=0)
+
+
+@pytest.mark.parametrize("error", [ContainerError("no docker"), OSError("disk full")])
+def test_spawn_failure_is_raised_from_acquire(manager_class, error):
+    manager_class.start_error = error
+    with ContainerPool(size=1, config=Config()) as pool:
+        with pytest.raises(ContainerError) as excinfo:
+            pool.acquire(timeout=5)
+
+    assert excinfo.value is error or excinfo.value.__cause__ is error
+
+
+def test_acquire_timeout(manager_class):
+    with ContainerPool(size=1, config=Config()) as pool:
+        pool.acquire(timeout=5)
+        pool._idle.get(timeout=5)  # take the replacement as well
+
+        with pytest.raises(ContainerError, match="within 0.01 seconds"):
+            pool.acquire(timeout=0.01)